@@ -30,6 +30,7 @@ from .entity import (
     ThermostatEntity,
     async_get_by_modules,
     async_get_by_product_type,
+    async_get_connected_modules,
     async_get_custom_entities,
 )
 
@@ -82,42 +83,42 @@ BINARY_SENSOR_TYPES: tuple[EcomaxBinarySensorEntityDescription, ...] = (
     EcomaxBinarySensorEntityDescription(
         key="fan",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="fan",
         value_fn=lambda x: x,
     ),
     EcomaxBinarySensorEntityDescription(
         key="fan2_exhaust",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="exhaust_fan",
         value_fn=lambda x: x,
     ),
     EcomaxBinarySensorEntityDescription(
         key="feeder",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="feeder",
         value_fn=lambda x: x,
     ),
     EcomaxBinarySensorEntityDescription(
         key="lighter",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="lighter",
         value_fn=lambda x: x,
     ),
     EcomaxBinarySensorEntityDescription(
         key="solar_pump",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="solar_pump",
         value_fn=lambda x: x,
     ),
     EcomaxBinarySensorEntityDescription(
         key="fireplace_pump",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="fireplace_pump",
         value_fn=lambda x: x,
     ),
@@ -138,12 +139,13 @@ class EcomaxBinarySensor(EcomaxEntity, BinarySensorEntity):
 @callback
 def async_setup_ecomax_binary_sensors(
     connection: EcomaxConnection,
+    modules: frozenset[str],
 ) -> list[EcomaxBinarySensor]:
     """Set up the ecoMAX binary sensors."""
     return [
         EcomaxBinarySensor(connection, description)
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(connection.product_type, BINARY_SENSOR_TYPES),
         )
     ]
@@ -177,14 +179,14 @@ MIXER_BINARY_SENSOR_TYPES: tuple[MixerBinarySensorEntityDescription, ...] = (
     MixerBinarySensorEntityDescription(
         key="pump",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="mixer_pump",
         value_fn=lambda x: x,
     ),
     MixerBinarySensorEntityDescription(
         key="pump",
         device_class=BinarySensorDeviceClass.RUNNING,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="circuit_pump",
         value_fn=lambda x: x,
     ),
@@ -210,13 +212,14 @@ class MixerBinarySensor(MixerEntity, EcomaxBinarySensor):
 @callback
 def async_setup_mixer_binary_sensors(
     connection: EcomaxConnection,
+    modules: frozenset[str],
 ) -> list[MixerBinarySensor]:
     """Set up the mixer binary sensors."""
     return [
         MixerBinarySensor(connection, description, index)
         for index in connection.device.mixers
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(
                 connection.product_type, MIXER_BINARY_SENSOR_TYPES
             ),
@@ -327,7 +330,8 @@ async def async_setup_entry(
     _LOGGER.debug("Starting setup of binary sensor platform...")
 
     connection = entry.runtime_data.connection
-    entities = async_setup_ecomax_binary_sensors(connection)
+    modules = async_get_connected_modules(connection.device.modules)
+    entities = async_setup_ecomax_binary_sensors(connection, modules)
 
     # Add custom ecoMAX binary sensors.
     entities += async_setup_custom_ecomax_binary_sensors(connection, entry)
@@ -340,7 +344,7 @@ async def async_setup_entry(
 
     # Add mixer/circuit binary sensors.
     if connection.has_mixers and await connection.async_setup_mixers():
-        entities += async_setup_mixer_binary_sensors(connection)
+        entities += async_setup_mixer_binary_sensors(connection, modules)
         entities += async_setup_custom_mixer_binary_sensors(connection, entry)
 
     # Add thermostat binary sensors.
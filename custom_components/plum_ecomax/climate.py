@@ -24,7 +24,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pyplumio.filters import Filter, on_change, throttle
+from pyplumio.filters import on_change, throttle
 from pyplumio.parameters.thermostat import ThermostatNumber
 
 from . import PlumEcomaxConfigEntry
@@ -90,7 +90,6 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
     _attr_target_temperature_name: str | None = None
     _attr_target_temperature_step = TEMPERATURE_STEP
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _callbacks: dict[str, Filter]
     entity_description: EcomaxClimateEntityDescription
 
     def __init__(
@@ -100,6 +99,8 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
         index: int,
     ):
         """Initialize a new ecoMAX climate entity."""
+        self.index = index
+        super().__init__(connection, description)
         self._callbacks = {
             "mode": on_change(self.async_update_preset_mode),
             "state": on_change(self.async_update_preset_mode),
@@ -107,8 +108,6 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
             "current_temp": throttle(on_change(self.async_update), seconds=10),
             "target_temp": on_change(self.async_update_target_temperature),
         }
-        self.index = index
-        super().__init__(connection, description)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -164,18 +163,9 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
         self._attr_hvac_action = HVACAction.HEATING if value else HVACAction.IDLE
         self.async_write_ha_state()
 
-    async def async_added_to_hass(self) -> None:
+    async def _async_subscribe(self) -> None:
         """Subscribe to thermostat events."""
-        for name, handler in self._callbacks.items():
-            if name in self.device.data:
-                await handler(self.device.data[name])
-
-            self.device.subscribe(name, handler)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from thermostat events."""
-        for name, handler in self._callbacks.items():
-            self.device.unsubscribe(name, handler)
+        await self._async_subscribe_callbacks()
 
     async def _async_update_target_temperature_attributes(
         self, target_temp: float | None = None
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Callable, Coroutine, Mapping
 from contextlib import suppress
+from copy import copy
 from functools import cached_property
 import logging
 import math
@@ -13,12 +14,15 @@ from typing import Any, Final, cast
 from homeassistant.components.network import async_get_source_ip
 from homeassistant.components.network.const import IPV4_BROADCAST_ADDR
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.entity import DeviceInfo
 import pyplumio
 from pyplumio.connection import Connection
 from pyplumio.const import FrameType, ProductType
-from pyplumio.devices import PhysicalDevice
+from pyplumio.devices import Device, PhysicalDevice
+from pyplumio.filters import is_close
+from pyplumio.parameters import Parameter
 from pyplumio.structures.mixer_parameters import ATTR_MIXER_PARAMETERS
 from pyplumio.structures.mixer_sensors import ATTR_MIXERS_CONNECTED
 from pyplumio.structures.temperatures import ATTR_WATER_HEATER_TEMP
@@ -31,6 +35,7 @@ from .const import (
     ATTR_THERMOSTATS,
     ATTR_WATER_HEATER,
     CONF_BAUDRATE,
+    CONF_CONNECTION_TYPE,
     CONF_DEVICE,
     CONF_HOST,
     CONF_MODEL,
@@ -45,7 +50,9 @@ from .const import (
     DEFAULT_DEVICE,
     DEFAULT_PORT,
     DOMAIN,
+    MANUFACTURER,
     DeviceType,
+    ModuleType,
 )
 
 ATTR_SETUP: Final = "setup"
@@ -60,6 +67,8 @@ FORCE_CLOSE_AFTER_SECONDS: Final = 10
 
 _LOGGER = logging.getLogger(__name__)
 
+type Handler = Callable[[Any], Coroutine[Any, Any, Any]]
+
 
 async def async_get_connection_handler(
     connection_type: str, hass: HomeAssistant, data: Mapping[str, Any]
@@ -126,10 +135,12 @@ class EcomaxConnection:
     _connection: Connection
     _device: PhysicalDevice | None
     _hass: HomeAssistant
+    _last: dict[tuple[Device, str], Any]
     entry: ConfigEntry
 
     _request_cache: dict[str, bool]
     _request_locks: dict[str, asyncio.Lock]
+    _subscribers: dict[tuple[Device, str, bool], tuple[Handler, list[Handler]]]
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, connection: Connection):
         """Initialize a new ecoMAX connection."""
@@ -138,8 +149,10 @@ class EcomaxConnection:
         self._hass = hass
         self.entry = entry
 
+        self._last = {}
         self._request_cache = {}
         self._request_locks = {}
+        self._subscribers = {}
 
     def __getattr__(self, name: str) -> Any:
         """Proxy calls to the underlying connection handler class."""
@@ -194,6 +207,79 @@ class EcomaxConnection:
             ATTR_REGDATA, FrameType.REQUEST_REGULATOR_DATA_SCHEMA
         )
 
+    @callback
+    def subscribe(
+        self,
+        device: Device,
+        name: str,
+        handler: Handler,
+        changes_only: bool = False,
+    ) -> None:
+        """Subscribe handler to the device value.
+
+        Only a single callback is registered with the device for each
+        value, which then dispatches the value to all subscribed handlers.
+        If changes_only is set, the value is checked for changes once
+        for all such handlers.
+        """
+        key = (device, name, changes_only)
+        if (subscription := self._subscribers.get(key)) is None:
+            subscribers: list[Handler] = []
+            if changes_only and name in device.data:
+                # Entities handle the current value themselves when added.
+                self._async_set_last(device, name, device.data[name])
+
+            async def _async_dispatch(value: Any) -> None:
+                """Dispatch value to the subscribed handlers."""
+                if changes_only:
+                    last_key = (device, name)
+                    if last_key in self._last and not is_close(
+                        self._last[last_key], value
+                    ):
+                        return
+
+                    self._async_set_last(device, name, value)
+
+                for handler in tuple(subscribers):
+                    await handler(value)
+
+            device.subscribe(name, _async_dispatch)
+            subscription = self._subscribers[key] = (_async_dispatch, subscribers)
+
+        subscription[1].append(handler)
+
+    @callback
+    def _async_set_last(self, device: Device, name: str, value: Any) -> None:
+        """Remember the last dispatched value.
+
+        Parameters are copied, as the device updates them in place.
+        """
+        self._last[(device, name)] = (
+            copy(value) if isinstance(value, Parameter) else value
+        )
+
+    @callback
+    def unsubscribe(self, device: Device, name: str, handler: Handler) -> None:
+        """Unsubscribe handler from the device value.
+
+        Once the last handler is gone, the callback is also removed from
+        the device.
+        """
+        for changes_only in (False, True):
+            key = (device, name, changes_only)
+            if (subscription := self._subscribers.get(key)) is None:
+                continue
+
+            dispatch, subscribers = subscription
+            with suppress(ValueError):
+                subscribers.remove(handler)
+
+            if not subscribers:
+                device.unsubscribe(name, dispatch)
+                del self._subscribers[key]
+                if changes_only:
+                    self._last.pop((device, name), None)
+
     async def async_close(self) -> None:
         """Close ecoMAX connection."""
         with suppress(asyncio.TimeoutError):
@@ -257,3 +343,20 @@ class EcomaxConnection:
     def name(self) -> str:
         """Return the connection name."""
         return self.entry.title
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by the ecoMAX entities."""
+        return DeviceInfo(
+            configuration_url=(
+                f"http://{self.entry.data[CONF_HOST]}"
+                if self.entry.data[CONF_CONNECTION_TYPE] == CONNECTION_TYPE_TCP
+                else None
+            ),
+            identifiers={(DOMAIN, self.uid)},
+            manufacturer=MANUFACTURER,
+            model=self.model,
+            name=self.name,
+            serial_number=self.uid,
+            sw_version=self.software[ModuleType.A],
+        )
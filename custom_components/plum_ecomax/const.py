@@ -72,6 +72,8 @@ DEFAULT_PORT: Final = 8899
 # Events.
 EVENT_PLUM_ECOMAX_ALERT: Final = "plum_ecomax_alert"
 
+MANUFACTURER: Final = "Plum Sp. z o.o."
+
 
 @unique
 class DeviceType(StrEnum):
@@ -8,35 +8,31 @@ from typing import Any, Final, Literal, cast, final, overload, override
 from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, Platform
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
-from pyplumio.const import ProductType
+from pyplumio.const import ATTR_CONNECTED, ProductType
 from pyplumio.devices import Device
 from pyplumio.devices.mixer import Mixer
 from pyplumio.devices.thermostat import Thermostat
-from pyplumio.filters import Filter, on_change, throttle
+from pyplumio.filters import Filter, throttle
 from pyplumio.structures.modules import ConnectedModules
 
 from custom_components.plum_ecomax import PlumEcomaxConfigEntry
 
-from .connection import EcomaxConnection
+from .connection import EcomaxConnection, Handler
 from .const import (
     ATTR_ENTITIES,
     ATTR_MIXERS,
     ATTR_REGDATA,
     ATTR_THERMOSTATS,
-    CONF_CONNECTION_TYPE,
-    CONF_HOST,
     CONF_SOURCE_DEVICE,
     CONF_STEP,
     CONF_UPDATE_INTERVAL,
-    CONNECTION_TYPE_TCP,
     DOMAIN,
+    MANUFACTURER,
     VIRTUAL_DEVICES,
     DeviceType,
     ModuleType,
 )
 
-MANUFACTURER: Final = "Plum Sp. z o.o."
-
 ALL: Final = "all"
 
 
@@ -46,9 +42,10 @@ class EcomaxEntityDescription(EntityDescription):
 
     always_available: bool = False
     entity_registry_enabled_default: bool = False
-    filter_fn: Callable[[Any], Filter] = on_change
+    # If no filter is set, the connection only dispatches changed values.
+    filter_fn: Callable[[Any], Filter] | None = None
     module: ModuleType = ModuleType.A
-    product_types: set[ProductType] | Literal["all"] = ALL
+    product_types: frozenset[ProductType] | Literal["all"] = ALL
 
 
 @callback
@@ -64,14 +61,24 @@ def async_get_by_product_type[DescriptorT: EcomaxEntityDescription](
 
 @callback
 def async_get_by_modules[DescriptorT: EcomaxEntityDescription](
-    connected_modules: ConnectedModules, descriptions: Iterable[DescriptorT]
+    modules: frozenset[str], descriptions: Iterable[DescriptorT]
 ) -> Generator[DescriptorT]:
-    """Filter descriptions by connected modules."""
+    """Filter descriptions by connected module names."""
     for description in descriptions:
-        if getattr(connected_modules, description.module, None) is not None:
+        if description.module in modules:
             yield description
 
 
+@callback
+def async_get_connected_modules(connected_modules: ConnectedModules) -> frozenset[str]:
+    """Return names of the connected modules."""
+    return frozenset(
+        module
+        for module in ModuleType
+        if getattr(connected_modules, module, None) is not None
+    )
+
+
 @callback
 def async_make_description_for_custom_entity[DescriptorT: EcomaxEntityDescription](
     description_factory: Callable[..., DescriptorT], entity: dict[str, Any]
@@ -155,10 +162,14 @@ def async_get_custom_entities[DescriptorT: EcomaxEntityDescription](
 class EcomaxEntity(Entity):
     """Represents an ecoMAX entity."""
 
+    _added: bool
     _always_available = False
     _attr_available = False
     _attr_has_entity_name = True
     _attr_should_poll = False
+    _callbacks: dict[str, Handler]
+    _connected: bool
+    _has_data: bool
     connection: EcomaxConnection
     entity_description: EcomaxEntityDescription
 
@@ -166,17 +177,35 @@ class EcomaxEntity(Entity):
         self, connection: EcomaxConnection, description: EcomaxEntityDescription
     ) -> None:
         """Initialize a new ecoMAX entity."""
+        self._added = False
+        self._attr_unique_id = f"{connection.uid}-{description.key}"
+        self._attr_device_info = connection.device_info
+        self._callbacks = {description.key: self._async_get_handler(description)}
         self.connection = connection
         self.entity_description = description
+        self._attr_entity_registry_enabled_default = (
+            description.entity_registry_enabled_default
+            or description.key in self.device.data
+        )
+        self._connected = connection.connected.is_set()
+        self._has_data = False
+        self._async_update_available()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to events."""
+        await self._async_subscribe()
+        self._added = True
+
+    async def _async_subscribe(self) -> None:
+        """Handle the current value and subscribe to its updates."""
         description = self.entity_description
-        handler = description.filter_fn(self.async_update)
+        handler = self._callbacks[description.key]
 
         async def _async_set_available(value: Any = None) -> None:
             """Mark entity as available."""
-            self._attr_available = True
+            self._has_data = True
+            self._async_update_available()
+            self.async_write_ha_state()
 
         if description.key in self.device.data:
             value = self.device.get_nowait(description.key, None)
@@ -185,57 +214,71 @@ class EcomaxEntity(Entity):
         else:
             self.device.subscribe_once(description.key, _async_set_available)
 
-        self.device.subscribe(description.key, handler)
+        self.connection.subscribe(
+            self.device,
+            description.key,
+            handler,
+            changes_only=description.filter_fn is None,
+        )
+        self._async_subscribe_connected()
+
+    async def _async_subscribe_callbacks(self) -> None:
+        """Handle the current values and subscribe all callbacks."""
+        for name, handler in self._callbacks.items():
+            if name in self.device.data:
+                await handler(self.device.data[name])
+
+            self.connection.subscribe(self.device, name, handler)
 
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from events."""
-        self.device.unsubscribe(self.entity_description.key, self.async_update)
+        self._added = False
+        for name, handler in self._callbacks.items():
+            self.connection.unsubscribe(self.device, name, handler)
 
-    @property
-    @override
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if self.entity_description.always_available:
-            return True
+        self.connection.unsubscribe(
+            self.connection.device, ATTR_CONNECTED, self._async_update_connected
+        )
 
-        return self.connection.connected.is_set() and self._attr_available
+    @callback
+    def _async_get_handler(self, description: EcomaxEntityDescription) -> Handler:
+        """Return the update handler wrapped in the description filter."""
+        if description.filter_fn is None:
+            return self.async_update
 
-    @property
-    @override
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added.
+        return description.filter_fn(self.async_update)
 
-        This only applies when fist added to the entity registry.
-        """
-        if self.entity_description.entity_registry_enabled_default:
-            return True
+    @callback
+    def _async_subscribe_connected(self) -> None:
+        """Subscribe to connection status changes."""
+        if not self.entity_description.always_available:
+            self.connection.subscribe(
+                self.connection.device, ATTR_CONNECTED, self._async_update_connected
+            )
 
-        return self.entity_description.key in self.device.data
+    async def _async_update_connected(self, connected: bool) -> None:
+        """Update availability on connection status change."""
+        self._connected = connected
+        self._async_update_available()
+        self.async_write_ha_state()
 
-    @cached_property
-    @override
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.connection.uid}-{self.entity_description.key}"
+    @callback
+    def _async_update_available(self) -> None:
+        """Update entity availability."""
+        self._attr_available = self.entity_description.always_available or (
+            self._connected and self._has_data
+        )
 
-    @cached_property
+    @callback
     @override
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            configuration_url=(
-                f"http://{self.connection.entry.data[CONF_HOST]}"
-                if self.connection.entry.data[CONF_CONNECTION_TYPE]
-                == CONNECTION_TYPE_TCP
-                else None
-            ),
-            identifiers={(DOMAIN, self.connection.uid)},
-            manufacturer=MANUFACTURER,
-            model=self.connection.model,
-            name=self.connection.name,
-            serial_number=self.connection.uid,
-            sw_version=self.connection.software[ModuleType.A],
-        )
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine.
+
+        Writes made before the entity has been added are skipped, as Home
+        Assistant writes the initial state once the entity is added.
+        """
+        if self._added:
+            super().async_write_ha_state()
 
     @cached_property
     def device(self) -> Device:
@@ -251,7 +294,7 @@ class EcomaxEntity(Entity):
 class SubdeviceEntityDescription(EcomaxEntityDescription):
     """Describes an ecoMAX entity."""
 
-    indexes: set[int] | Literal["all"] = ALL
+    indexes: frozenset[int] | Literal["all"] = ALL
 
 
 @callback
@@ -270,31 +313,27 @@ class ThermostatEntity(EcomaxEntity):
 
     index: int
 
-    @cached_property
-    @override
-    def unique_id(self) -> str:
-        """Return the unique ID."""
-        return (
-            f"{self.connection.uid}-{DeviceType.THERMOSTAT}-"
-            + f"{self.index}-{self.entity_description.key}"
+    def __init__(
+        self, connection: EcomaxConnection, description: EcomaxEntityDescription
+    ) -> None:
+        """Initialize a new thermostat entity."""
+        super().__init__(connection, description)
+        self._attr_unique_id = (
+            f"{connection.uid}-{DeviceType.THERMOSTAT}-"
+            + f"{self.index}-{description.key}"
         )
-
-    @cached_property
-    @override
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
+        self._attr_device_info = DeviceInfo(
             translation_key="thermostat",
             translation_placeholders={
-                "device_name": self.connection.name,
+                "device_name": connection.name,
                 "thermostat_number": str(self.index + 1),
             },
             identifiers={
-                (DOMAIN, f"{self.connection.uid}-{DeviceType.THERMOSTAT}-{self.index}")
+                (DOMAIN, f"{connection.uid}-{DeviceType.THERMOSTAT}-{self.index}")
             },
             manufacturer=MANUFACTURER,
-            sw_version=self.connection.software[ModuleType.ECOSTER],
-            via_device=(DOMAIN, self.connection.uid),
+            sw_version=connection.software[ModuleType.ECOSTER],
+            via_device=(DOMAIN, connection.uid),
         )
 
     @cached_property
@@ -311,34 +350,30 @@ class MixerEntity(EcomaxEntity):
 
     index: int
 
-    @cached_property
-    @override
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return (
-            f"{self.connection.uid}-{DeviceType.MIXER}-"
-            + f"{self.index}-{self.entity_description.key}"
+    def __init__(
+        self, connection: EcomaxConnection, description: EcomaxEntityDescription
+    ) -> None:
+        """Initialize a new mixer entity."""
+        super().__init__(connection, description)
+        self._attr_unique_id = (
+            f"{connection.uid}-{DeviceType.MIXER}-"
+            + f"{self.index}-{description.key}"
         )
-
-    @cached_property
-    @override
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
+        self._attr_device_info = DeviceInfo(
             translation_key=(
                 "circuit"
-                if self.connection.product_type == ProductType.ECOMAX_I
+                if connection.product_type == ProductType.ECOMAX_I
                 else "mixer"
             ),
             translation_placeholders={
-                "device_name": self.connection.name,
+                "device_name": connection.name,
                 "mixer_number": str(self.index + 1),
             },
             identifiers={
-                (DOMAIN, f"{self.connection.uid}-{DeviceType.MIXER}-{self.index}")
+                (DOMAIN, f"{connection.uid}-{DeviceType.MIXER}-{self.index}")
             },
             manufacturer=MANUFACTURER,
-            via_device=(DOMAIN, self.connection.uid),
+            via_device=(DOMAIN, connection.uid),
         )
 
     @cached_property
@@ -361,27 +396,31 @@ class RegdataEntity(EcomaxEntity):
         """Initialize a new regdata entity."""
         self._regdata_key = int(description.key)
         super().__init__(connection, description)
+        self._callbacks = {ATTR_REGDATA: self._async_get_handler(description)}
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to regdata event."""
-        description = self.entity_description
-        handler = description.filter_fn(self.async_update)
+    async def _async_subscribe(self) -> None:
+        """Handle the current regdata and subscribe to its updates."""
+        handler = self._callbacks[ATTR_REGDATA]
 
         async def async_set_available(regdata: dict[int, Any]) -> None:
             """Mark entity as available."""
             if self._regdata_key in regdata:
-                self._attr_available = True
+                self._has_data = True
+                self._async_update_available()
+                self.async_write_ha_state()
 
         if ATTR_REGDATA in self.device.data:
             await async_set_available(self.device.data[ATTR_REGDATA])
             await handler(self.device.data[ATTR_REGDATA])
 
         self.device.subscribe_once(ATTR_REGDATA, async_set_available)
-        self.device.subscribe(ATTR_REGDATA, handler)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from regdata event."""
-        self.device.unsubscribe(ATTR_REGDATA, self.async_update)
+        self.connection.subscribe(
+            self.device,
+            ATTR_REGDATA,
+            handler,
+            changes_only=self.entity_description.filter_fn is None,
+        )
+        self._async_subscribe_connected()
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 from typing import Any, cast
 
@@ -16,26 +18,44 @@ from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyplumio.const import ProductType
-from pyplumio.parameters import Parameter
+from pyplumio.devices import PhysicalDevice
+from pyplumio.parameters import Number
 
 from . import PlumEcomaxConfigEntry
 from .connection import EcomaxConnection
 from .const import DeviceType
 from .entity import (
+    ALL,
     EcomaxEntity,
     EcomaxEntityDescription,
     MixerEntity,
     SubdeviceEntityDescription,
     ThermostatEntity,
-    async_get_by_index,
-    async_get_by_modules,
     async_get_by_product_type,
+    async_get_connected_modules,
     async_get_custom_entities,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _filtered[SubDescriptorT: SubdeviceEntityDescription](
+    descriptions: Iterable[SubDescriptorT], modules: frozenset[str], index: int
+) -> tuple[SubDescriptorT, ...]:
+    """Filter descriptions by connected modules and the index in one pass."""
+    index += 1
+    results: list[SubDescriptorT] = []
+    for description in descriptions:
+        if description.module not in modules:
+            continue
+
+        indexes = description.indexes
+        if indexes == ALL or index in indexes:
+            results.append(description)
+
+    return tuple(results)
+
+
 @dataclass(frozen=True, kw_only=True)
 class EcomaxNumberEntityDescription(EcomaxEntityDescription, NumberEntityDescription):
     """Describes an ecoMAX number."""
@@ -47,7 +67,7 @@ NUMBER_TYPES: tuple[EcomaxNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="target_heating_temp",
     ),
     EcomaxNumberEntityDescription(
@@ -55,7 +75,7 @@ NUMBER_TYPES: tuple[EcomaxNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="min_heating_temp",
     ),
     EcomaxNumberEntityDescription(
@@ -63,7 +83,7 @@ NUMBER_TYPES: tuple[EcomaxNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="max_heating_temp",
     ),
     EcomaxNumberEntityDescription(
@@ -71,28 +91,28 @@ NUMBER_TYPES: tuple[EcomaxNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="grate_mode_temp",
     ),
     EcomaxNumberEntityDescription(
         key="min_fuzzy_logic_power",
         native_step=1,
         native_unit_of_measurement=PERCENTAGE,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="fuzzy_logic_min_power",
     ),
     EcomaxNumberEntityDescription(
         key="max_fuzzy_logic_power",
         native_step=1,
         native_unit_of_measurement=PERCENTAGE,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="fuzzy_logic_max_power",
     ),
     EcomaxNumberEntityDescription(
         key="fuel_calorific_value",
         mode=NumberMode.BOX,
         native_step=0.1,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="fuel_calorific_value",
     ),
     EcomaxNumberEntityDescription(
@@ -100,38 +120,57 @@ NUMBER_TYPES: tuple[EcomaxNumberEntityDescription, ...] = (
         translation_key="heating_hysteresis",
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
     ),
     EcomaxNumberEntityDescription(
         key="h1_hysteresis",
         translation_key="h1_hysteresis",
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
     ),
     EcomaxNumberEntityDescription(
         key="h2_hysteresis",
         translation_key="h2_hysteresis",
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
     ),
     EcomaxNumberEntityDescription(
         key="heating_pump_enable_temp",
         translation_key="heating_pump_enable_temp",
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
     ),
     EcomaxNumberEntityDescription(
         key="water_heater_hysteresis",
         translation_key="water_heater_hysteresis",
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
     ),
 )
 
+NUMBER_TYPES_BY_PRODUCT: dict[
+    ProductType, tuple[EcomaxNumberEntityDescription, ...]
+] = {
+    product_type: tuple(async_get_by_product_type(product_type, NUMBER_TYPES))
+    for product_type in ProductType
+}
+
+
+@lru_cache(maxsize=32)
+def _get_number_types(
+    product_type: ProductType, modules: frozenset[str]
+) -> tuple[EcomaxNumberEntityDescription, ...]:
+    """Return number descriptions for the product type and connected modules."""
+    return tuple(
+        description
+        for description in NUMBER_TYPES_BY_PRODUCT.get(product_type, ())
+        if description.module in modules
+    )
+
 
 class EcomaxNumber(EcomaxEntity, NumberEntity):
     """Represents an ecoMAX number."""
@@ -144,23 +183,33 @@ class EcomaxNumber(EcomaxEntity, NumberEntity):
         self._attr_native_value = value
         self.async_write_ha_state()
 
-    async def async_update(self, value: Parameter) -> None:
+    async def async_update(self, value: Number) -> None:
         """Update entity state."""
-        self._attr_native_value = cast(float, value.value)
-        self._attr_native_min_value = cast(float, value.min_value)
-        self._attr_native_max_value = cast(float, value.max_value)
+        state = (value.value, value.min_value, value.max_value)
+        if state == (
+            self._attr_native_value,
+            getattr(self, "_attr_native_min_value", None),
+            getattr(self, "_attr_native_max_value", None),
+        ):
+            # Skip the state write, as nothing has changed.
+            return
+
+        (
+            self._attr_native_value,
+            self._attr_native_min_value,
+            self._attr_native_max_value,
+        ) = state
         self.async_write_ha_state()
 
 
 @callback
-def async_setup_ecomax_numbers(connection: EcomaxConnection) -> list[EcomaxNumber]:
+def async_setup_ecomax_numbers(
+    connection: EcomaxConnection, product_type: ProductType, modules: frozenset[str]
+) -> list[EcomaxNumber]:
     """Set up the ecoMAX numbers."""
     return [
         EcomaxNumber(connection, description)
-        for description in async_get_by_modules(
-            connection.device.modules,
-            async_get_by_product_type(connection.product_type, NUMBER_TYPES),
-        )
+        for description in _get_number_types(product_type, modules)
     ]
 
 
@@ -193,7 +242,7 @@ MIXER_NUMBER_TYPES: tuple[MixerNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="target_mixer_temp",
     ),
     MixerNumberEntityDescription(
@@ -201,7 +250,7 @@ MIXER_NUMBER_TYPES: tuple[MixerNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="min_mixer_temp",
     ),
     MixerNumberEntityDescription(
@@ -209,7 +258,7 @@ MIXER_NUMBER_TYPES: tuple[MixerNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="max_mixer_temp",
     ),
     MixerNumberEntityDescription(
@@ -217,47 +266,64 @@ MIXER_NUMBER_TYPES: tuple[MixerNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="target_circuit_temp",
     ),
     MixerNumberEntityDescription(
         key="min_target_temp",
         device_class=NumberDeviceClass.TEMPERATURE,
-        indexes={2, 3},
+        indexes=frozenset({2, 3}),
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="min_circuit_temp",
     ),
     MixerNumberEntityDescription(
         key="max_target_temp",
         device_class=NumberDeviceClass.TEMPERATURE,
-        indexes={2, 3},
+        indexes=frozenset({2, 3}),
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="max_circuit_temp",
     ),
     MixerNumberEntityDescription(
         key="day_target_temp",
         device_class=NumberDeviceClass.TEMPERATURE,
-        indexes={2, 3},
+        indexes=frozenset({2, 3}),
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="day_target_circuit_temp",
     ),
     MixerNumberEntityDescription(
         key="night_target_temp",
         device_class=NumberDeviceClass.TEMPERATURE,
-        indexes={2, 3},
+        indexes=frozenset({2, 3}),
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="night_target_circuit_temp",
     ),
 )
 
+MIXER_NUMBER_TYPES_BY_PRODUCT: dict[
+    ProductType, tuple[MixerNumberEntityDescription, ...]
+] = {
+    product_type: tuple(async_get_by_product_type(product_type, MIXER_NUMBER_TYPES))
+    for product_type in ProductType
+}
+
+
+@lru_cache(maxsize=32)
+def _get_mixer_number_types(
+    product_type: ProductType, modules: frozenset[str], index: int
+) -> tuple[MixerNumberEntityDescription, ...]:
+    """Return mixer number descriptions for the product type, modules and index."""
+    return _filtered(
+        MIXER_NUMBER_TYPES_BY_PRODUCT.get(product_type, ()), modules, index
+    )
+
 
 class MixerNumber(MixerEntity, EcomaxNumber):
     """Represents a mixer number."""
@@ -276,18 +342,17 @@ class MixerNumber(MixerEntity, EcomaxNumber):
 
 
 @callback
-def async_setup_mixer_numbers(connection: EcomaxConnection) -> list[MixerNumber]:
+def async_setup_mixer_numbers(
+    connection: EcomaxConnection,
+    device: PhysicalDevice,
+    product_type: ProductType,
+    modules: frozenset[str],
+) -> list[MixerNumber]:
     """Set up the mixer numbers."""
     return [
         MixerNumber(connection, description, index)
-        for index in cast(dict[int, Any], connection.device.mixers)
-        for description in async_get_by_index(
-            index,
-            async_get_by_modules(
-                connection.device.modules,
-                async_get_by_product_type(connection.product_type, MIXER_NUMBER_TYPES),
-            ),
-        )
+        for index in cast(dict[int, Any], device.mixers)
+        for description in _get_mixer_number_types(product_type, modules, index)
     ]
 
 
@@ -355,14 +420,19 @@ async def async_setup_entry(
     _LOGGER.debug("Starting setup of number platform...")
 
     connection = entry.runtime_data.connection
-    entities = async_setup_ecomax_numbers(connection)
+    device = connection.device
+    modules = async_get_connected_modules(device.modules)
+    product_type = connection.product_type
+    entities = async_setup_ecomax_numbers(connection, product_type, modules)
 
     # Add custom ecoMAX numbers.
     entities += async_setup_custom_ecomax_numbers(connection, entry)
 
     # Add mixer/circuit numbers.
     if connection.has_mixers and await connection.async_setup_mixers():
-        entities += async_setup_mixer_numbers(connection)
+        entities += async_setup_mixer_numbers(
+            connection, device, product_type, modules
+        )
         entities += async_setup_custom_mixer_numbers(connection, entry)
 
     # Add thermostat numbers.
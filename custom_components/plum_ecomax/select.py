@@ -22,6 +22,7 @@ from .entity import (
     async_get_by_index,
     async_get_by_modules,
     async_get_by_product_type,
+    async_get_connected_modules,
 )
 
 STATE_SUMMER: Final = "summer"
@@ -78,14 +79,14 @@ MIXER_SELECT_TYPES: tuple[EcomaxMixerSelectEntityDescription, ...] = (
     EcomaxMixerSelectEntityDescription(
         key="work_mode",
         options=[STATE_OFF, STATE_HEATING, STATE_HEATED_FLOOR, STATE_PUMP_ONLY],
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="mixer_work_mode",
     ),
     EcomaxMixerSelectEntityDescription(
         key="enable_circuit",
-        indexes={2, 3},
+        indexes=frozenset({2, 3}),
         options=[STATE_OFF, STATE_HEATING, STATE_HEATED_FLOOR],
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         translation_key="mixer_work_mode",
     ),
 )
@@ -108,19 +109,23 @@ class MixerSelect(MixerEntity, EcomaxSelect):
 
 
 @callback
-def async_setup_ecomax_selects(connection: EcomaxConnection) -> list[EcomaxSelect]:
+def async_setup_ecomax_selects(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[EcomaxSelect]:
     """Set up the ecoMAX selects."""
     return [
         EcomaxSelect(connection, description)
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(connection.product_type, SELECT_TYPES),
         )
     ]
 
 
 @callback
-def async_setup_mixer_selects(connection: EcomaxConnection) -> list[MixerSelect]:
+def async_setup_mixer_selects(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[MixerSelect]:
     """Set up the mixer selects."""
     return [
         MixerSelect(connection, description, index)
@@ -128,7 +133,7 @@ def async_setup_mixer_selects(connection: EcomaxConnection) -> list[MixerSelect]
         for description in async_get_by_index(
             index,
             async_get_by_modules(
-                connection.device.modules,
+                modules,
                 async_get_by_product_type(connection.product_type, MIXER_SELECT_TYPES),
             ),
         )
@@ -144,11 +149,12 @@ async def async_setup_entry(
     _LOGGER.debug("Starting setup of select platform...")
 
     connection = entry.runtime_data.connection
-    entities = async_setup_ecomax_selects(connection)
+    modules = async_get_connected_modules(connection.device.modules)
+    entities = async_setup_ecomax_selects(connection, modules)
 
     # Add mixer/circuit selects.
     if connection.has_mixers and await connection.async_setup_mixers():
-        entities += async_setup_mixer_selects(connection)
+        entities += async_setup_mixer_selects(connection, modules)
 
     async_add_entities(entities)
     return True
@@ -50,6 +50,7 @@ from .entity import (
     ThermostatEntity,
     async_get_by_modules,
     async_get_by_product_type,
+    async_get_connected_modules,
     async_get_custom_entities,
 )
 
@@ -187,7 +188,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
         ),
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="boiler_power",
@@ -196,7 +197,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
     EcomaxSensorEntityDescription(
         key="fuel_level",
         native_unit_of_measurement=PERCENTAGE,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
         translation_key="fuel_level",
@@ -207,7 +208,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
         filter_fn=lambda x: throttle(
             deadband(x, tolerance=0.001), seconds=UPDATE_INTERVAL
         ),
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
         translation_key="fuel_consumption",
@@ -219,7 +220,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=PERCENTAGE,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         translation_key="boiler_load",
         value_fn=lambda x: x,
@@ -228,7 +229,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
         key="fan_power",
         filter_fn=lambda x: throttle(on_change(x), seconds=UPDATE_INTERVAL),
         native_unit_of_measurement=PERCENTAGE,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="fan_power",
@@ -240,7 +241,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=PERCENTAGE,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="flame_intensity",
@@ -253,7 +254,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="feeder_temp",
@@ -266,7 +267,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="exhaust_temp",
@@ -279,7 +280,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="return_temp",
@@ -292,7 +293,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="lower_buffer_temp",
@@ -305,7 +306,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="upper_buffer_temp",
@@ -318,7 +319,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="lower_solar_temp",
@@ -331,7 +332,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="upper_solar_temp",
@@ -344,7 +345,7 @@ SENSOR_TYPES: tuple[EcomaxSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="fireplace_temp",
@@ -376,12 +377,14 @@ class EcomaxSensor(EcomaxEntity, SensorEntity):
 
 
 @callback
-def async_setup_ecomax_sensors(connection: EcomaxConnection) -> list[EcomaxSensor]:
+def async_setup_ecomax_sensors(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[EcomaxSensor]:
     """Set up the ecoMAX sensors."""
     return [
         EcomaxSensor(connection, description)
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(connection.product_type, SENSOR_TYPES),
         )
     ]
@@ -417,7 +420,7 @@ MIXER_SENSOR_TYPES: tuple[MixerSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="mixer_temp",
@@ -428,7 +431,7 @@ MIXER_SENSOR_TYPES: tuple[MixerSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         filter_fn=lambda x: throttle(on_change(x), seconds=UPDATE_INTERVAL),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="mixer_target_temp",
@@ -441,7 +444,7 @@ MIXER_SENSOR_TYPES: tuple[MixerSensorEntityDescription, ...] = (
             deadband(x, tolerance=DEFAULT_TOLERANCE), seconds=UPDATE_INTERVAL
         ),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="circuit_temp",
@@ -452,7 +455,7 @@ MIXER_SENSOR_TYPES: tuple[MixerSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         filter_fn=lambda x: throttle(on_change(x), seconds=UPDATE_INTERVAL),
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        product_types={ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_I}),
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="circuit_target_temp",
@@ -478,13 +481,15 @@ class MixerSensor(MixerEntity, EcomaxSensor):
 
 
 @callback
-def async_setup_mixer_sensors(connection: EcomaxConnection) -> list[MixerSensor]:
+def async_setup_mixer_sensors(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[MixerSensor]:
     """Set up the mixer sensors."""
     return [
         MixerSensor(connection, description, index)
         for index in connection.device.mixers
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(connection.product_type, MIXER_SENSOR_TYPES),
         )
     ]
@@ -518,7 +523,7 @@ METER_TYPES: tuple[EcomaxMeterEntityDescription, ...] = (
         always_available=True,
         filter_fn=lambda x: aggregate(x, seconds=30, sample_size=50),
         native_unit_of_measurement=UnitOfMass.KILOGRAMS,
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=3,
         translation_key="total_fuel_burned",
@@ -577,12 +582,14 @@ class EcomaxMeter(EcomaxSensor, RestoreSensor):
 
 
 @callback
-def async_setup_ecomax_meters(connection: EcomaxConnection) -> list[EcomaxMeter]:
+def async_setup_ecomax_meters(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[EcomaxMeter]:
     """Set up the ecoMAX meters."""
     return [
         EcomaxMeter(connection, description)
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(connection.product_type, METER_TYPES),
         )
     ]
@@ -670,7 +677,8 @@ async def async_setup_entry(
     _LOGGER.debug("Starting setup of sensor platform...")
 
     connection = entry.runtime_data.connection
-    entities = async_setup_ecomax_sensors(connection)
+    modules = async_get_connected_modules(connection.device.modules)
+    entities = async_setup_ecomax_sensors(connection, modules)
 
     # Add custom ecoMAX sensors.
     entities += async_setup_custom_ecomax_sensors(connection, entry)
@@ -683,7 +691,7 @@ async def async_setup_entry(
 
     # Add mixer/circuit sensors.
     if connection.has_mixers and await connection.async_setup_mixers():
-        entities += async_setup_mixer_sensors(connection)
+        entities += async_setup_mixer_sensors(connection, modules)
         entities += async_setup_custom_mixer_sensors(connection, entry)
 
     # Add thermostat sensors.
@@ -691,7 +699,7 @@ async def async_setup_entry(
         entities += async_setup_custom_thermostat_sensors(connection, entry)
 
     # Add ecoMAX meters.
-    if meters := async_setup_ecomax_meters(connection):
+    if meters := async_setup_ecomax_meters(connection, modules):
         entities += meters
         platform = async_get_current_platform()
         platform.async_register_entity_service(
@@ -25,6 +25,7 @@ from .entity import (
     async_get_by_index,
     async_get_by_modules,
     async_get_by_product_type,
+    async_get_connected_modules,
     async_get_custom_entities,
 )
 
@@ -58,22 +59,22 @@ SWITCH_TYPES: tuple[EcomaxSwitchEntityDescription, ...] = (
     ),
     EcomaxSwitchEntityDescription(
         key="weather_control",
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="weather_control_switch",
     ),
     EcomaxSwitchEntityDescription(
         key="fuzzy_logic",
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="fuzzy_logic_switch",
     ),
     EcomaxSwitchEntityDescription(
         key="heating_schedule_switch",
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="heating_schedule_switch",
     ),
     EcomaxSwitchEntityDescription(
         key="water_heater_schedule_switch",
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="water_heater_schedule_switch",
     ),
 )
@@ -113,12 +114,14 @@ class EcomaxSwitch(EcomaxEntity, SwitchEntity):
 
 
 @callback
-def async_setup_ecomax_switches(connection: EcomaxConnection) -> list[EcomaxSwitch]:
+def async_setup_ecomax_switches(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[EcomaxSwitch]:
     """Set up the ecoMAX switches."""
     return [
         EcomaxSwitch(connection, description)
         for description in async_get_by_modules(
-            connection.device.modules,
+            modules,
             async_get_by_product_type(connection.product_type, SWITCH_TYPES),
         )
     ]
@@ -150,23 +153,23 @@ class MixerSwitchEntityDescription(
 MIXER_SWITCH_TYPES: tuple[MixerSwitchEntityDescription, ...] = (
     MixerSwitchEntityDescription(
         key="summer_work",
-        product_types={ProductType.ECOMAX_P, ProductType.ECOMAX_I},
+        product_types=frozenset({ProductType.ECOMAX_P, ProductType.ECOMAX_I}),
         translation_key="enable_in_summer_mode",
     ),
     MixerSwitchEntityDescription(
         key="weather_control",
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="weather_control_switch",
     ),
     MixerSwitchEntityDescription(
         key="disable_pump_on_thermostat",
-        product_types={ProductType.ECOMAX_P},
+        product_types=frozenset({ProductType.ECOMAX_P}),
         translation_key="disable_pump_on_thermostat",
     ),
     MixerSwitchEntityDescription(
         key="enable_circuit",
-        indexes={1},
-        product_types={ProductType.ECOMAX_I},
+        indexes=frozenset({1}),
+        product_types=frozenset({ProductType.ECOMAX_I}),
         state_off=0,
         state_on=1,
         translation_key="enable_circuit",
@@ -191,7 +194,9 @@ class MixerSwitch(MixerEntity, EcomaxSwitch):
 
 
 @callback
-def async_setup_mixer_switches(connection: EcomaxConnection) -> list[MixerSwitch]:
+def async_setup_mixer_switches(
+    connection: EcomaxConnection, modules: frozenset[str]
+) -> list[MixerSwitch]:
     """Set up the mixers switches."""
     return [
         MixerSwitch(connection, description, index)
@@ -199,7 +204,7 @@ def async_setup_mixer_switches(connection: EcomaxConnection) -> list[MixerSwitch
         for description in async_get_by_index(
             index,
             async_get_by_modules(
-                connection.device.modules,
+                modules,
                 async_get_by_product_type(connection.product_type, MIXER_SWITCH_TYPES),
             ),
         )
@@ -270,14 +275,15 @@ async def async_setup_entry(
     _LOGGER.debug("Starting setup of switch platform...")
 
     connection = entry.runtime_data.connection
-    entities = async_setup_ecomax_switches(connection)
+    modules = async_get_connected_modules(connection.device.modules)
+    entities = async_setup_ecomax_switches(connection, modules)
 
     # Add custom ecoMAX switches.
     entities += async_setup_custom_ecomax_switches(connection, entry)
 
     # Add mixer/circuit switches.
     if connection.has_mixers and await connection.async_setup_mixers():
-        entities += async_setup_mixer_switches(connection)
+        entities += async_setup_mixer_switches(connection, modules)
         entities += async_setup_custom_mixer_switches(connection, entry)
 
     # Add thermostat switches.
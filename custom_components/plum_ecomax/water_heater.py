@@ -22,7 +22,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pyplumio.filters import Filter, on_change, throttle
+from pyplumio.filters import on_change, throttle
 from pyplumio.parameters import Parameter
 
 from . import PlumEcomaxConfigEntry
@@ -64,7 +64,6 @@ class EcomaxWaterHeater(EcomaxEntity, WaterHeaterEntity):
         | WaterHeaterEntityFeature.OPERATION_MODE
     )
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _callbacks: dict[str, Filter]
     entity_description: EcomaxWaterHeaterEntityDescription
 
     def __init__(
@@ -73,13 +72,13 @@ class EcomaxWaterHeater(EcomaxEntity, WaterHeaterEntity):
         description: EcomaxWaterHeaterEntityDescription,
     ):
         """Initialize a new ecoMAX climate entity."""
+        super().__init__(connection, description)
         self._callbacks = {
             "water_heater_temp": throttle(on_change(self.async_update), seconds=10),
             "water_heater_target_temp": on_change(self.async_update_target_temp),
             "water_heater_work_mode": on_change(self.async_update_work_mode),
             "water_heater_hysteresis": on_change(self.async_update_hysteresis),
         }
-        super().__init__(connection, description)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -127,18 +126,9 @@ class EcomaxWaterHeater(EcomaxEntity, WaterHeaterEntity):
         self._attr_current_temperature = value
         self.async_write_ha_state()
 
-    async def async_added_to_hass(self) -> None:
+    async def _async_subscribe(self) -> None:
         """Subscribe to water heater events."""
-        for name, handler in self._callbacks.items():
-            if name in self.device.data:
-                await handler(self.device.data[name])
-
-            self.device.subscribe(name, handler)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe to water heater events."""
-        for name, handler in self._callbacks.items():
-            self.device.unsubscribe(name, handler)
+        await self._async_subscribe_callbacks()
 
     @property
     def hysteresis(self) -> int:
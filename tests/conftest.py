@@ -57,6 +57,7 @@ from custom_components.plum_ecomax.const import (
     DEFAULT_DEVICE,
     DEFAULT_PORT,
     DOMAIN,
+    ModuleType,
 )
 
 TITLE: Final = "ecoMAX"
@@ -189,6 +190,19 @@ def fixture_connection(
     return connection
 
 
+@pytest.fixture(name="mock_connection")
+def fixture_mock_connection(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> Mock:
+    """Get mocked ecoMAX connection."""
+    mock_connection = Mock(spec=EcomaxConnection)
+    mock_connection.device = ecomax_p
+    mock_connection.entry = config_entry
+    mock_connection.software = {ModuleType.A: "6.10.32.K1"}
+    mock_connection.uid = "test_uid"
+    mock_connection.connected = Mock(spec=asyncio.Event)
+    mock_connection.connected.is_set.return_value = True
+    return mock_connection
+
+
 @pytest.fixture
 def connected():
     """Integration is connected."""
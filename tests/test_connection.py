@@ -8,6 +8,7 @@ from homeassistant.components.network.const import IPV4_BROADCAST_ADDR
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.entity import DeviceInfo
 from pyplumio import RequestError
 from pyplumio.connection import Connection, SerialConnection, TcpConnection
 from pyplumio.const import FrameType
@@ -37,7 +38,10 @@ from custom_components.plum_ecomax.const import (
     CONF_UID,
     CONNECTION_TYPE_SERIAL,
     CONNECTION_TYPE_TCP,
+    DOMAIN,
+    MANUFACTURER,
     DeviceType,
+    ModuleType,
 )
 
 SOURCE_IP: Final = "1.1.1.1"
@@ -127,6 +131,16 @@ async def test_async_setup(
     assert connection.device == mock_ecomax
     assert connection.product_type == tcp_config_data.get(CONF_PRODUCT_TYPE)
     assert connection.product_id == tcp_config_data.get(CONF_PRODUCT_ID)
+    assert connection.device_info == DeviceInfo(
+        configuration_url=f"http://{tcp_config_data.get(CONF_HOST)}",
+        identifiers={(DOMAIN, connection.uid)},
+        manufacturer=MANUFACTURER,
+        model=connection.model,
+        name=connection.name,
+        serial_number=connection.uid,
+        sw_version=connection.software[ModuleType.A],
+    )
+    assert connection.device_info is connection.device_info
 
     # Check with device timeout.
     with pytest.raises(TimeoutError):
@@ -242,3 +256,73 @@ async def test_async_setup_regdata(
     )
     if error_message:
         assert error_message in caplog.text
+
+
+async def test_subscribe(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Test subscribing handlers to the device values."""
+    connection = EcomaxConnection(hass, config_entry, AsyncMock(spec=TcpConnection))
+    mock_device = Mock(spec=EcoMAX)
+    mock_device.data = {}
+    mock_handler1 = AsyncMock()
+    mock_handler2 = AsyncMock()
+
+    # Test that only a single callback is registered with the device.
+    connection.subscribe(mock_device, "heating_temp", mock_handler1)
+    connection.subscribe(mock_device, "heating_temp", mock_handler2)
+    mock_device.subscribe.assert_called_once()
+    name, dispatch = mock_device.subscribe.call_args.args
+    assert name == "heating_temp"
+
+    # Test that value is dispatched to all handlers.
+    await dispatch(65.0)
+    mock_handler1.assert_awaited_once_with(65.0)
+    mock_handler2.assert_awaited_once_with(65.0)
+
+    # Test unsubscribing handler.
+    mock_handler1.reset_mock()
+    mock_handler2.reset_mock()
+    connection.unsubscribe(mock_device, "heating_temp", mock_handler1)
+    connection.unsubscribe(mock_device, "nonexistent", mock_handler1)
+    await dispatch(70.0)
+    mock_handler1.assert_not_awaited()
+    mock_handler2.assert_awaited_once_with(70.0)
+
+    # Test that changed values are checked once for all handlers.
+    mock_handler3 = AsyncMock()
+    mock_handler4 = AsyncMock()
+    mock_device.subscribe.reset_mock()
+    connection.subscribe(mock_device, "heating_temp", mock_handler3, changes_only=True)
+    connection.subscribe(mock_device, "heating_temp", mock_handler4, changes_only=True)
+    mock_device.subscribe.assert_called_once()
+    _, dispatch_changes = mock_device.subscribe.call_args.args
+    await dispatch_changes(70.0)
+    await dispatch_changes(70.0)
+    mock_handler3.assert_awaited_once_with(70.0)
+    mock_handler4.assert_awaited_once_with(70.0)
+
+    # Test unsubscribing handler that only receives changed values.
+    connection.unsubscribe(mock_device, "heating_temp", mock_handler3)
+    await dispatch_changes(75.0)
+    mock_handler3.assert_awaited_once_with(70.0)
+    mock_handler4.assert_awaited_with(75.0)
+
+    # Test that changes are checked against the current value.
+    mock_handler5 = AsyncMock()
+    mock_device.data = {"water_heater_temp": 50.0}
+    mock_device.subscribe.reset_mock()
+    connection.subscribe(
+        mock_device, "water_heater_temp", mock_handler5, changes_only=True
+    )
+    _, dispatch_primed = mock_device.subscribe.call_args.args
+    await dispatch_primed(50.0)
+    mock_handler5.assert_not_awaited()
+    await dispatch_primed(55.0)
+    mock_handler5.assert_awaited_once_with(55.0)
+
+    # Test that device callbacks are removed with the last handler.
+    mock_device.unsubscribe.assert_not_called()
+    connection.unsubscribe(mock_device, "heating_temp", mock_handler2)
+    mock_device.unsubscribe.assert_called_once_with("heating_temp", dispatch)
+    mock_device.unsubscribe.reset_mock()
+    connection.unsubscribe(mock_device, "heating_temp", mock_handler4)
+    mock_device.unsubscribe.assert_called_once_with("heating_temp", dispatch_changes)
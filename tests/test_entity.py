@@ -1,29 +1,22 @@
 """Test Plum ecoMAX base entity."""
 
-import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, Mock, call, patch
 
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant
+from pyplumio.connection import Connection
+from pyplumio.const import ATTR_CONNECTED
 from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.filters import Filter
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.plum_ecomax.connection import EcomaxConnection
-from custom_components.plum_ecomax.const import DOMAIN, ModuleType
-from custom_components.plum_ecomax.entity import (
-    MANUFACTURER,
-    EcomaxEntity,
-    EcomaxEntityDescription,
-)
+from custom_components.plum_ecomax.entity import EcomaxEntity, EcomaxEntityDescription
 
 
-async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> None:
+async def test_base_entity(mock_connection: Mock) -> None:
     """Test base entity."""
-    mock_connection = Mock(spec=EcomaxConnection)
-    mock_connection.device = ecomax_p
-    mock_connection.entry = config_entry
-    mock_connection.software = {ModuleType.A: "6.10.32.K1"}
     mock_filter = AsyncMock(spec=Filter)
     entity = EcomaxEntity(
         connection=mock_connection,
@@ -36,39 +29,67 @@ async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> N
     )
 
     # Test adding entity to hass.
-    with patch.object(
-        mock_connection.device, "subscribe", create=True
-    ) as mock_subscribe:
-        await entity.async_added_to_hass()
-
+    await entity.async_added_to_hass()
     mock_filter.assert_called_once()
-    mock_subscribe.assert_has_calls([call("heating_temp", mock_filter)])
+    mock_connection.subscribe.assert_has_calls(
+        [
+            call(
+                mock_connection.device,
+                "heating_temp",
+                mock_filter,
+                changes_only=False,
+            ),
+            call(
+                mock_connection.device,
+                ATTR_CONNECTED,
+                entity._async_update_connected,
+            ),
+        ]
+    )
+
+    # Test availability.
+    assert entity.available
+    with patch.object(entity, "async_write_ha_state") as mock_async_write_ha_state:
+        await entity._async_update_connected(False)
+
+    mock_async_write_ha_state.assert_called_once()
+    assert not entity.available
+    with patch.object(  # type: ignore[unreachable]
+        entity, "async_write_ha_state"
+    ) as mock_async_write_ha_state:
+        await entity._async_update_connected(True)
+
+    mock_async_write_ha_state.assert_called_once()
+    assert entity.available
 
     # Test removing entity from the hass.
-    with (
-        patch.object(EcomaxEntity, "async_update") as mock_async_update,
-        patch.object(mock_connection.device, "unsubscribe") as mock_unsubscribe,
-    ):
-        await entity.async_will_remove_from_hass()
+    await entity.async_will_remove_from_hass()
+    mock_connection.unsubscribe.assert_has_calls(
+        [
+            call(mock_connection.device, "heating_temp", mock_filter),
+            call(
+                mock_connection.device,
+                ATTR_CONNECTED,
+                entity._async_update_connected,
+            ),
+        ]
+    )
+
+    # Test that state is not written after entity is removed.
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_async_write_ha_state:
+        entity.async_write_ha_state()
 
-    mock_unsubscribe.assert_called_once_with("heating_temp", mock_async_update)
+    mock_async_write_ha_state.assert_not_called()
 
     # Test device property.
     assert entity.device == mock_connection.device
 
     # Test device info property.
-    assert entity.device_info == DeviceInfo(
-        configuration_url="http://localhost",
-        identifiers={(DOMAIN, mock_connection.uid)},
-        manufacturer=MANUFACTURER,
-        model=mock_connection.model,
-        name=mock_connection.name,
-        serial_number=mock_connection.uid,
-        sw_version=mock_connection.software[ModuleType.A],
-    )
+    assert entity.device_info is mock_connection.device_info
 
     # Test unique id property.
-    mock_connection.uid = "test_uid"
     assert entity.unique_id == "test_uid-heating_temp"
 
     # Test should poll property.
@@ -76,28 +97,38 @@ async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> N
 
     # Test enabled by default property.
     assert entity.entity_registry_enabled_default
-    entity.entity_description = EcomaxEntityDescription(
-        key="test_data2", name="ecoMAX Data 2"
+    entity_disabled = EcomaxEntity(
+        connection=mock_connection,
+        description=EcomaxEntityDescription(key="test_data2", name="ecoMAX Data 2"),
+    )
+    assert not entity_disabled.entity_registry_enabled_default
+    entity_enabled = EcomaxEntity(
+        connection=mock_connection,
+        description=EcomaxEntityDescription(
+            key="test_data2",
+            name="ecoMAX Data 2",
+            entity_registry_enabled_default=True,
+        ),
     )
-    assert not entity.entity_registry_enabled_default
+    assert entity_enabled.entity_registry_enabled_default
 
     # Test exception when calling update on base entity class.
-    with pytest.raises(NotImplementedError):  # type: ignore[unreachable]
+    with pytest.raises(NotImplementedError):
         await entity.async_update("test")
 
-    # Test availability.
-    mock_connection.connected = Mock(spec=asyncio.Event)
-    mock_connection.connected.is_set.return_value = True
-    assert entity.available
+    # Test availability of always available entity.
     mock_connection.connected.is_set.return_value = False
-    assert not entity.available
-    entity.entity_description = EcomaxEntityDescription(
-        key="heating_temp",
-        name="Heating temperature",
-        always_available=True,
-        filter_fn=Mock(return_value=mock_filter),
+    entity_always_available = EcomaxEntity(
+        connection=mock_connection,
+        description=EcomaxEntityDescription(
+            key="heating_temp",
+            name="Heating temperature",
+            always_available=True,
+            filter_fn=Mock(return_value=mock_filter),
+        ),
     )
-    assert entity.available
+    assert entity_always_available.available
+    mock_connection.connected.is_set.return_value = True
     mock_connection.reset_mock()
 
     # Test availability when source data is not available right away.
@@ -110,7 +141,80 @@ async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> N
             filter_fn=Mock(return_value=mock_filter),
         ),
     )
+
+    # Test that state is not written before entity is added.
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_async_write_ha_state:
+        entity2.async_write_ha_state()
+
+    mock_async_write_ha_state.assert_not_called()
+
     with patch.object(mock_connection.device, "subscribe_once") as mock_subscribe_once:
         await entity2.async_added_to_hass()
 
     mock_subscribe_once.assert_called_once()
+    assert not entity2.available
+
+    # Test that changes are filtered by connection when there's no filter.
+    mock_connection.reset_mock()
+    with patch.object(EcomaxEntity, "async_update") as mock_async_update:
+        entity3 = EcomaxEntity(
+            connection=mock_connection,
+            description=EcomaxEntityDescription(key="heating_temp", name="Heating"),
+        )
+        await entity3.async_added_to_hass()
+
+    mock_async_update.assert_awaited_once()
+    mock_connection.subscribe.assert_any_call(
+        mock_connection.device, "heating_temp", mock_async_update, changes_only=True
+    )
+
+    # Test that state is written after entity is added.
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_async_write_ha_state:
+        entity2.async_write_ha_state()
+
+    mock_async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.usefixtures("connected")
+async def test_entities_sharing_key(
+    hass: HomeAssistant, ecomax_p: EcoMAX, config_entry: MockConfigEntry
+) -> None:
+    """Test availability of entities that share the same key."""
+    connection = EcomaxConnection(hass, config_entry, AsyncMock(spec=Connection))
+    writes: list[tuple[EcomaxEntity, bool]] = []
+
+    class TestEntity(EcomaxEntity):
+        """Represents a test entity."""
+
+        async def async_update(self, value: Any) -> None:
+            """Update entity state."""
+            self.async_write_ha_state()
+
+    entity1, entity2 = (
+        TestEntity(
+            connection=connection,
+            description=EcomaxEntityDescription(key="test_value", name=name),
+        )
+        for name in ("Test value 1", "Test value 2")
+    )
+    await entity1.async_added_to_hass()
+    await entity2.async_added_to_hass()
+    assert not entity1.available
+    assert not entity2.available
+
+    # Test that both entities end up written as available.
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state",
+        autospec=True,
+        side_effect=lambda entity: writes.append((entity, entity.available)),
+    ):
+        await ecomax_p.dispatch("test_value", 1)
+
+    assert entity1.available  # type: ignore[unreachable]
+    assert entity2.available
+    assert [available for entity, available in writes if entity is entity1][-1]
+    assert [available for entity, available in writes if entity is entity2][-1]
@@ -1,7 +1,7 @@
 """Test the number platform."""
 
 from math import isclose
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from homeassistant.components.number import (
     ATTR_MAX,
@@ -26,13 +26,20 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
+from pyplumio.const import ProductType
+from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.parameters import ParameterValues
 from pyplumio.parameters.ecomax import EcomaxNumber, EcomaxNumberDescription
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.plum_ecomax.connection import EcomaxConnection
-from custom_components.plum_ecomax.const import ATTR_ENTITIES
+from custom_components.plum_ecomax.const import ATTR_ENTITIES, ModuleType
+from custom_components.plum_ecomax.number import (
+    NUMBER_TYPES,
+    EcomaxNumber as EcomaxNumberEntity,
+    _get_mixer_number_types,
+)
 from tests.conftest import FLOAT_TOLERANCE, dispatch_value
 
 
@@ -1070,3 +1077,33 @@ async def test_custom_numbers(
     mock_set_nowait.assert_called_once_with(custom_number_key, 40)
     assert isinstance(state, State)
     assert state.state == "40.0"
+
+
+async def test_number_update_skips_unchanged_state(
+    ecomax_p: EcoMAX, mock_connection: Mock
+) -> None:
+    """Test that number doesn't write state if parameter is unchanged."""
+    entity = EcomaxNumberEntity(mock_connection, NUMBER_TYPES[0])
+    parameter = EcomaxNumber(
+        device=ecomax_p,
+        values=ParameterValues(value=65, min_value=30, max_value=80),
+        description=EcomaxNumberDescription(NUMBER_TYPES[0].key),
+    )
+
+    with patch.object(entity, "async_write_ha_state") as mock_async_write_ha_state:
+        await entity.async_update(parameter)
+        await entity.async_update(parameter)
+
+    mock_async_write_ha_state.assert_called_once()
+    assert entity.native_value == 65
+    assert entity.native_min_value == 30
+    assert entity.native_max_value == 80
+
+
+@pytest.mark.parametrize("product_type", (ProductType.ECOMAX_P, ProductType.ECOMAX_I))
+async def test_mixer_number_types_for_any_index(product_type: ProductType) -> None:
+    """Test that mixer numbers are not limited by the mixer index."""
+    modules = frozenset({ModuleType.A})
+    descriptions = _get_mixer_number_types(product_type, modules, 0)
+    assert descriptions
+    assert _get_mixer_number_types(product_type, modules, 8) == descriptions